@@ -6,67 +6,48 @@ This module contains several different classes aimed at solving the proposed
 bin-packing problem variant.
 """
 
-from __future__ import unicode_literals
+import bisect
+import collections
+import functools
+import math
 
-import abc
-import itertools
+from . import solvers_kernels
 
+# Maximum number of cells in the table of reachable capacities above which
+# bin-combinations are enumerated instead.
+DP_TABLE_SIZE_MAX = 2 ** 16
 
-class RegistrySolvers(type):
-    """Registry metaclass for the solver classes
+# Result of a search for n-length minimum-capacity bin combinations holding
+# the combinations and their common capacity (`None` if none were found).
+FitResult = collections.namedtuple("FitResult", "capacity combos")
 
-    This metaclass can be set under a given base class so that any classes
-    deriving that base will be added to a `registry` dictionary available to
-    all registered classes.
 
-    This registry will be key'ed on the class name while the value will contain
-    a reference to that class object.
-
-    This registry can be used as a discovery mechanism for derived classes
-    without having to register them explicitly.
-    """
-
-    def __init__(cls, class_name, class_bases, class_dict):
-        # if the class doesn't have a 'registry' dict then create an empty one
-        if not hasattr(cls, 'registry'):
-            cls.registry = {}
-
-        # add the registered class as an entry in the registry
-        cls.registry[class_name] = cls
-
-        # initialise the base class
-        super(RegistrySolvers, cls).__init__(
-            class_name,
-            class_bases,
-            class_dict
-        )
-
-    def __new__(mcs, class_name, class_bases, class_dict):
-        # if the class doesn't have a 'registry' dict then create an empty one
-        if not hasattr(mcs, 'registry'):
-            mcs.registry = {}
+class SolverBase(object):
+    """Solver base-class
 
-        # add the registered class as an entry in the registry
-        mcs.registry[class_name] = mcs
+    Any class deriving this base-class and defining a `solver_type` is added
+    to a `_registry` dictionary, key'ed on that `solver_type`, which is used
+    as a discovery mechanism for the solvers without having to register them
+    explicitly.
 
-        newclass = super(mcs, RegistrySolvers).__new__(
-            mcs,
-            class_name,
-            class_bases,
-            class_dict
-        )
+    Solvers define `__slots__` so that the attributes read by the searches are
+    fetched directly from their slots rather than through an instance
+    dictionary. The load and bins are read-only as the searches run on values
+    derived from them upon instantiation.
+    """
 
-        return newclass
+    __slots__ = ("_load", "_bins", "_gcd", "_load_reduced", "_bins_key")
 
+    _registry = {}
 
-class SolverBase(object):
-    """Solver base-class"""
+    solver_type = None
 
-    # Use the registry metaclass to autoregister this base-class as well as all
-    # classes deriving it.
-    __metaclass__ = RegistrySolvers
+    def __init_subclass__(cls, **kwargs):
+        super(SolverBase, cls).__init_subclass__(**kwargs)
 
-    solver_type = None
+        # Register the derived class under its solver type.
+        if cls.solver_type:
+            SolverBase._registry[cls.solver_type] = cls
 
     def __init__(
         self,
@@ -78,6 +59,17 @@ class SolverBase(object):
         self._load = load
         self._bins = bins
 
+        # The problem is identical once the load and bins are divided by their
+        # greatest common divisor so the searches run on the reduced values,
+        # which shrinks the tables of reachable capacities, and scale the
+        # found combinations back.
+        self._gcd = functools.reduce(math.gcd, bins, load) or 1
+        self._load_reduced = load // self._gcd
+
+        # Sorted distinct reduced bin sizes, computed once, used by the
+        # searches and to key the cached bin-combinations.
+        self._bins_key = tuple(sorted(set(b // self._gcd for b in bins)))
+
     @property
     def load(self):
         """The load defined upon instantiation."""
@@ -95,66 +87,347 @@ class SolverBase(object):
         the bins defined upon instantiation of the class) that can accommodate
         the defined load while minimizing capacity.
 
+        Combinations are returned as sorted tuples, in lexicographic order,
+        and are distinct even if the defined bins contain repeated sizes as
+        the search runs over the distinct bin sizes and picks bins in
+        ascending order.
+
         Note:
             There is no guarantee that any combinations can be found for a
             defined length `n`. Should no such combinations be found an empty
-            list is returned.
+            tuple of combinations is returned.
 
         Args:
             n (int): The length of the bin-combinations through which the
                 search is performed.
 
         Returns:
-            list: A list of the found n-length bin combinations or an empty
-                list if not combinations were found.
+            FitResult: The common capacity of the found n-length bin
+                combinations, or `None`, and a tuple of the combinations, or an
+                empty tuple if no combinations were found.
         """
 
-        # Lazily evaluate all replacement-combinations of the defined bin
-        # sizes.
-        combinations = itertools.combinations_with_replacement(
-            self.bins, r=n
+        # Forward to the cached search so that solvers sharing the same load
+        # and bins don't repeat the search for an already evaluated length.
+        result = _fit_n_bins_cached(
+            bins_key=self._bins_key,
+            load=self._load_reduced,
+            n=n
         )
 
-        # Initialize the minimum capacity as a infinite number.
-        capacity_min = float("inf")
+        # The cached result is immutable so it can be returned as is.
+        if self._gcd == 1 or result.capacity is None:
+            return result
+
+        # Scale the combinations of reduced bin sizes back to the bin sizes.
+        gcd = self._gcd
+        return FitResult(
+            capacity=result.capacity * gcd,
+            combos=tuple(
+                tuple(size * gcd for size in combo) for combo in result.combos
+            )
+        )
 
-        # List to hold all n-length combinations of bins that can accomodate
-        # the defined load.
-        combos = []
-        for combination in combinations:
+    def length_min(self):
+        """The minimum length of any bin-combination accommodating the load.
 
-            # Calculate the capacity of the current bin combination.
-            capacity = sum(combination)
+        As no bin exceeds the largest one, no combination shorter than the
+        load over the largest bin, rounded up, can accommodate the load.
+        """
+        return max(1, -(-self._load_reduced // self._bins_key[-1]))
 
-            # Skip combinations that can't accommodate the current load.
-            if capacity < self.load:
-                continue
+    @staticmethod
+    def cache_clear():
+        """Clears the cache of previously found bin-combinations."""
+        _fit_n_bins_cached.cache_clear()
+        solvers_kernels.sizes_array.cache_clear()
+
+    def solve(self):
+        """Solves the problem, implemented by the derived classes."""
+        raise NotImplementedError
+
+
+def _backtrack_combinations(reachable, sizes, n, capacity, size_min=0):
+    """Yields all n-length bin combinations of a given capacity
+
+    This function backtracks through the table of reachable capacities built
+    in `_fit_n_bins_cached` and yields every combination of `n` bins whose
+    capacity is exactly `capacity`. Bins are picked in ascending order so that
+    each combination is yielded once, as a sorted tuple, and combinations are
+    yielded in lexicographic order.
+
+    Args:
+        reachable (list): The table of reachable capacities where
+            `reachable[i][c]` is `True` if an i-length combination of bins has
+            a capacity of exactly `c`.
+        sizes (list): The sorted distinct bin sizes.
+        n (int): The length of the bin-combinations.
+        capacity (int): The capacity of the bin-combinations.
+        size_min (int): The smallest bin size that may be picked.
+
+    Yields:
+        tuple: A sorted n-length bin combination with the given capacity.
+    """
+
+    if n == 0:
+        if capacity == 0:
+            yield ()
+        return
+
+    for size in sizes:
+        # Skip bins smaller than the previously picked one.
+        if size < size_min:
+            continue
+
+        # As bins are picked in ascending order the remaining bins can't
+        # accommodate less than `n - 1` times the current bin.
+        remainder = capacity - size
+        if remainder < (n - 1) * size:
+            break
+
+        if not reachable[n - 1][remainder]:
+            continue
+
+        for combination in _backtrack_combinations(
+            reachable=reachable,
+            sizes=sizes,
+            n=n - 1,
+            capacity=remainder,
+            size_min=size
+        ):
+            yield (size,) + combination
+
+
+def _enumerate_multiset_sums(sizes, n, load, capacity_max=math.inf):
+    """Enumerates n-length bin combinations that may minimize capacity
+
+    This function walks through the replacement-combinations of `sizes` as a
+    vector of non-decreasing indices while keeping a running sum of the picked
+    bins, so that each step costs a single addition or subtraction instead of
+    summing a whole combination. Combinations are only materialized when they
+    can accommodate the load with no more than the minimum capacity found so
+    far while branches that can't, or that can't accommodate the load at
+    all, are pruned. As the bin sizes are sorted and distinct, only the
+    smallest bin accommodating the rest of the load can minimize capacity at
+    the last position so that bin is looked up directly instead of scanning
+    through the larger ones.
+
+    Note:
+        As the minimum capacity decreases during the enumeration, yielded
+        combinations with a capacity above the last yielded one should be
+        discarded by the caller.
+
+    Args:
+        sizes (tuple): The sorted distinct bin sizes.
+        n (int): The length of the bin-combinations.
+        load (int): The load to be fit into the bins.
+        capacity_max (int, float): The maximum capacity of the yielded
+            combinations.
+
+    Yields:
+        tuple: A `(capacity, combination)` pair for every n-length bin
+            combination that can accommodate the load with a capacity no
+            greater than any previously yielded one.
+    """
 
-            # Should the combination have a capacity lower than the current
-            # `capacity_min` then replace any previously accepted combinations
-            # and skip to the next combination.
-            if capacity_min > capacity:
-                capacity_min = capacity
-                combos = [combination]
+    # Bind the names used within the loop locally to avoid repeated global
+    # and attribute lookups.
+    num_sizes = len(sizes)
+    size_max = sizes[-1]
+    size_of = sizes.__getitem__
+    n_last = n - 1
+    _bisect_left = bisect.bisect_left
+    _tuple = tuple
+    _map = map
+    capacity_min = capacity_max
+
+    # `idx[:i]` holds the indices of the bins picked for the first `i`
+    # positions, `cur_sum` their capacity, and `j` the index of the bin
+    # considered for position `i`.
+    idx = [0] * n
+    i = 0
+    j = 0
+    cur_sum = 0
+    while True:
+        if i == n_last:
+            # Pick the smallest bin, no smaller than the previous one, that
+            # accommodates the rest of the load.
+            j = _bisect_left(sizes, load - cur_sum, j)
+            if j < num_sizes:
+                capacity = cur_sum + size_of(j)
+                if capacity <= capacity_min:
+                    idx[i] = j
+                    capacity_min = capacity
+                    yield capacity, _tuple(_map(size_of, idx))
+        elif j < num_sizes:
+            size = size_of(j)
+            remaining = n - i
+
+            # As indices are non-decreasing the remaining positions can't hold
+            # bins smaller than the current one so prune the branch should
+            # that already exceed the minimum capacity. Similarly prune the
+            # branch should even the largest bins fail to accommodate the load.
+            if (
+                cur_sum + remaining * size <= capacity_min and
+                cur_sum + remaining * size_max >= load
+            ):
+                # Pick the bin and move on to the next position.
+                idx[i] = j
+                cur_sum += size
+                i += 1
                 continue
 
-            # Append any combinations with a capacity identical to the current
-            # minimum, i.e., store alternative combinations.
-            if capacity_min == capacity:
-                combos.append(combination)
+        # Backtrack to the previous position and try its next larger bin,
+        # updating the running sum by the single bin removed.
+        i -= 1
+        if i < 0:
+            return
+        j = idx[i]
+        cur_sum -= size_of(j)
+        j += 1
 
-        # If new combination(s) that can accommodate the current load were found
-        # then return them.
-        if capacity_min >= self.load and capacity_min != float("inf"):
-            return combos
 
-        # At this point no n-length combinations that can accommodate the
-        # defined load were found so an empty list is returned.
-        return []
+def _fit_n_bins_enumerate(bins_key, load, n):
+    """Finds n-length minimum-capacity bin combinations via enumeration
 
-    @abc.abstractmethod
-    def solve(self):
-        raise NotImplementedError
+    Args:
+        bins_key (tuple): The sorted distinct bin sizes.
+        load (int): The load to be fit into the bins.
+        n (int): The length of the bin-combinations.
+
+    Returns:
+        FitResult: The capacity and a tuple of the found n-length bin
+            combinations.
+    """
+
+    # No n-length combination can exceed `n` times the largest bin.
+    capacity_max = n * bins_key[-1]
+
+    # Use a compiled kernel, preferring the Cython extension over Numba, if
+    # either is available.
+    if solvers_kernels.CYTHON_AVAILABLE:
+        fit_n_bins_compiled = solvers_kernels.fit_n_bins_cython
+    elif solvers_kernels.NUMBA_AVAILABLE:
+        fit_n_bins_compiled = solvers_kernels.fit_n_bins_numba
+    else:
+        fit_n_bins_compiled = None
+
+    if fit_n_bins_compiled is not None:
+        capacity_min, combos = fit_n_bins_compiled(
+            sizes=bins_key,
+            n=n,
+            load=load,
+            capacity_max=capacity_max
+        )
+        return FitResult(capacity=capacity_min, combos=combos)
+
+    capacity_min = None
+    combos = []
+    for capacity, combination in _enumerate_multiset_sums(
+        sizes=bins_key,
+        n=n,
+        load=load,
+        capacity_max=capacity_max
+    ):
+        # Should the combination have a capacity lower than the current
+        # `capacity_min` then replace any previously accepted combinations.
+        if capacity_min is None or capacity < capacity_min:
+            capacity_min = capacity
+            combos = []
+
+        combos.append(combination)
+
+    return FitResult(capacity=capacity_min, combos=tuple(combos))
+
+
+def _fit_n_bins_dp(bins_key, load, n):
+    """Finds n-length minimum-capacity bin combinations via tabulation
+
+    Args:
+        bins_key (tuple): The sorted distinct bin sizes.
+        load (int): The load to be fit into the bins.
+        n (int): The length of the bin-combinations.
+
+    Returns:
+        FitResult: The capacity and a tuple of the found n-length bin
+            combinations.
+    """
+
+    capacity_max = n * bins_key[-1]
+
+    # Tabulate which capacities can be reached by combinations of every
+    # length up to `n`, i.e., `reachable[i][c]` is `True` if an i-length
+    # combination of bins has a capacity of exactly `c`.
+    reachable = [[False] * (capacity_max + 1) for _ in range(n + 1)]
+    reachable[0][0] = True
+    _any = any
+    size_min = bins_key[0]
+    size_max = bins_key[-1]
+    for i in range(1, n + 1):
+        row = reachable[i]
+        row_prev = reachable[i - 1]
+        for c in range(i * size_min, i * size_max + 1):
+            row[c] = _any(row_prev[c - s] for s in bins_key if s <= c)
+
+    # The minimum capacity is the first reachable one that can accommodate
+    # the defined load (there's always one as `capacity_max` is reachable).
+    row = reachable[n]
+    capacity_min = load
+    while not row[capacity_min]:
+        capacity_min += 1
+
+    # Reconstruct all n-length combinations with the minimum capacity.
+    combos = tuple(_backtrack_combinations(
+        reachable=reachable,
+        sizes=bins_key,
+        n=n,
+        capacity=capacity_min
+    ))
+
+    return FitResult(capacity=capacity_min, combos=combos)
+
+
+@functools.lru_cache(maxsize=None)
+def _fit_n_bins_cached(bins_key, load, n):
+    """Finds all n-length minimum-capacity bin combinations for a load
+
+    This function implements the search behind `SolverBase.fit_n_bins`. Its
+    results are cached so that they're shared between solvers and repeated
+    calls, hence it returns immutable, hashable, tuples.
+
+    The search tabulates reachable capacities when the table is small enough.
+    Otherwise, as the cost of tabulation grows with the magnitude of the bin
+    sizes, it falls back to enumerating combinations.
+
+    Args:
+        bins_key (tuple): The sorted distinct bin sizes.
+        load (int): The load to be fit into the bins.
+        n (int): The length of the bin-combinations.
+
+    Returns:
+        FitResult: The capacity, or `None`, and a tuple of the found n-length
+            bin combinations, or an empty tuple if no combinations were found.
+    """
+
+    # No n-length combination can exceed `n` times the largest bin so should
+    # even the largest bins fail to accommodate the load then no n-length
+    # combinations exist.
+    capacity_max = n * bins_key[-1]
+    if n < 1 or capacity_max < load:
+        return FitResult(capacity=None, combos=())
+
+    if (n + 1) * (capacity_max + 1) <= DP_TABLE_SIZE_MAX:
+        return _fit_n_bins_dp(
+            bins_key=bins_key,
+            load=load,
+            n=n
+        )
+
+    return _fit_n_bins_enumerate(
+        bins_key=bins_key,
+        load=load,
+        n=n
+    )
 
 
 class SolverLengthFirst(SolverBase):
@@ -167,6 +440,8 @@ class SolverLengthFirst(SolverBase):
         The solution(s) may yield to over-capacity.
     """
 
+    __slots__ = ()
+
     solver_type = "length"
 
     def __init__(
@@ -184,15 +459,16 @@ class SolverLengthFirst(SolverBase):
     def solve(self):
         """Solves the problem minimizing combination length."""
 
-        n = 0
+        # Skip lengths too short to accommodate the load altogether.
+        n = self.length_min() - 1
 
         # Keep iterating while incrementing the allowed combination length until
         # a combination that can accommodate the defined load has been found.
         while True:
             n += 1
-            combos = self.fit_n_bins(n=n)
-            if combos:
-                return combos
+            result = self.fit_n_bins(n=n)
+            if result.combos:
+                return result.combos
 
 
 class SolverCapacityFirst(SolverBase):
@@ -205,6 +481,8 @@ class SolverCapacityFirst(SolverBase):
         The solution(s) may yield to longer bin-combinations.
     """
 
+    __slots__ = ()
+
     solver_type = "capacity"
 
     def __init__(
@@ -222,16 +500,33 @@ class SolverCapacityFirst(SolverBase):
     def solve(self):
         """Solves the problem minimizing combination over-capacity."""
 
-        n = 0
-
-        # Keep iterating while incrementing the allowed combination length until
-        # a combination with a capacity identical to the defined load has been
-        # found.
-        while True:
-            n += 1
-            combos = self.fit_n_bins(n=n)
-            if combos and sum(combos[0]) == self.load:
-                return combos
+        load = self._load_reduced
+        sizes = self._bins_key
+
+        # Adding bins to a combination until it accommodates the load never
+        # overshoots by a whole largest bin so the minimum capacity lies
+        # within a largest bin above the load (or above zero as combinations
+        # can't be empty).
+        capacity_start = max(load, 1)
+        capacity_end = capacity_start + sizes[-1]
+
+        # Tabulate the length of the shortest combination of bins with a
+        # capacity of exactly `c`, or `inf` if there's none, as an unbounded
+        # knapsack over the capacities.
+        inf = math.inf
+        _min = min
+        lengths = [inf] * capacity_end
+        lengths[0] = 0
+        for c in range(max(sizes[0], 1), capacity_end):
+            lengths[c] = _min(
+                lengths[c - size] for size in sizes if size <= c
+            ) + 1
+
+        # Find the minimum capacity that can accommodate the defined load and
+        # retrieve all the shortest combinations with that capacity.
+        for c in range(capacity_start, capacity_end):
+            if lengths[c] != inf:
+                return self.fit_n_bins(n=lengths[c]).combos
 
 
 class SolverCombo(SolverBase):
@@ -243,6 +538,8 @@ class SolverCombo(SolverBase):
     the over-capacity objective over the minimum-length objective.
     """
 
+    __slots__ = ()
+
     solver_type = "combo"
 
     def __init__(
@@ -259,39 +556,33 @@ class SolverCombo(SolverBase):
     def solve(self):
         """Solves the problem with min over-capacity over min length"""
 
-        n = 1
+        # Skip lengths too short to accommodate the load altogether.
+        n = self.length_min()
 
-        # Get the n-length combinations (if any) that can accommodate the
-        # defined load.
-        combos_n = self.fit_n_bins(n=n)
+        # Find the shortest combinations that can accommodate the defined load.
+        result_n = self.fit_n_bins(n=n)
+        while not result_n.combos:
+            n += 1
+            result_n = self.fit_n_bins(n=n)
 
-        while True:
-            # Get the n+1-length combinations (if any) that can accommodate the
-            # defined load.
-            combos_np1 = self.fit_n_bins(n=n + 1)
-
-            # If no viable combinations were found for both n and n + 1 lengths
-            # the increment the defined length, swap the combinations and skip
-            # to the next iteration
-            if not combos_n or not combos_np1:
-                combos_n = combos_np1
-                n += 1
-                continue
+        # Get the n+1-length combinations which, as the n-length ones can
+        # accommodate the load, always exist.
+        result_np1 = self.fit_n_bins(n=n + 1)
+
+        # If the n + 1 length combinations happen to offer decreased capacity
+        # then prefer those combinations over the shorter yet more wasteful
+        # combinations.
+        if result_np1.capacity < result_n.capacity:
+            return result_np1.combos
 
-            # if the n + 1 length combinations happen to offer decreased
-            # capacity then prefer those combinations over the shorter yet more
-            # wasteful combinations
-            if sum(combos_n[0]) > sum(combos_np1[0]):
-                return combos_np1
-            else:
-                return combos_n
+        return result_n.combos
 
 
 def create_solver(load, bins, solver_type):
     """Instantiates a solver of given `solver_type`
 
-    This function iterates over the solver registry and creates a solver for a
-    given `solver_type` with the defined `load` and `bins`.
+    This function looks up the solver registry and creates a solver for a given
+    `solver_type` with the defined `load` and `bins`.
 
     Note:
         Should the defined `solver_type` not be supported by any of the
@@ -309,8 +600,8 @@ def create_solver(load, bins, solver_type):
             instantiated with the given `load` and `bins`.
     """
 
-    # Iterate over the solvers registry and create an instance for the
-    # solver with the defined `solver_type` attribute.
-    for solver_name, solver_cls in SolverBase.registry.items():
-        if solver_cls.solver_type == solver_type:
-            return solver_cls(load=load, bins=bins)
+    # Look up the solver registered under the defined `solver_type` and create
+    # an instance of it.
+    solver_cls = SolverBase._registry.get(solver_type)
+    if solver_cls is not None:
+        return solver_cls(load=load, bins=bins)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+""" Cython-compiled core of the bin-combination enumeration.
+
+This optional extension module contains a C version of the index-vector
+enumeration behind `solvers_kernels._fit_n_bins_kernel`. It's built from
+`setup.py` when Cython is available and used by the solvers over the Numba and
+pure-Python versions when importable.
+"""
+
+from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
+from libc.stdint cimport int64_t
+from libc.string cimport memcpy
+
+import numpy
+
+
+def fit_n_bins_core(
+    const int64_t[::1] sizes,
+    Py_ssize_t n,
+    int64_t load,
+    int64_t capacity_max
+):
+    """Enumerates n-length minimum-capacity bin combinations
+
+    Args:
+        sizes (numpy.ndarray): The sorted distinct bin sizes as an `int64`
+            array.
+        n (int): The length of the bin-combinations.
+        load (int): The load to be fit into the bins.
+        capacity_max (int): The maximum capacity of the found combinations.
+
+    Returns:
+        tuple: The minimum capacity and an `(M, n)` array holding the indices
+            of the bins, within `sizes`, of each of the `M` found
+            combinations.
+    """
+
+    cdef Py_ssize_t num_sizes = sizes.shape[0]
+    cdef int64_t size_max = sizes[num_sizes - 1]
+    cdef int64_t capacity_min = capacity_max
+    cdef int64_t capacity
+    cdef int64_t cur_sum = 0
+    cdef int64_t size
+    cdef Py_ssize_t remaining
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t k
+
+    # Output buffer of bin-indices grown by doubling when full.
+    cdef Py_ssize_t combos_max = 16
+    cdef Py_ssize_t num_combos = 0
+    cdef int64_t *combos
+    cdef int64_t *grown
+    cdef int64_t *idx
+    cdef int64_t[:, ::1] result_view
+
+    idx = <int64_t *> PyMem_Malloc(n * sizeof(int64_t))
+    combos = <int64_t *> PyMem_Malloc(combos_max * n * sizeof(int64_t))
+    if idx == NULL or combos == NULL:
+        PyMem_Free(idx)
+        PyMem_Free(combos)
+        raise MemoryError()
+
+    try:
+        while i >= 0:
+            if j < num_sizes:
+                size = sizes[j]
+                remaining = n - i
+                if (
+                    cur_sum + remaining * size <= capacity_min and
+                    cur_sum + remaining * size_max >= load
+                ):
+                    if i < n - 1:
+                        # Pick the bin and move on to the next position.
+                        idx[i] = j
+                        cur_sum += size
+                        i += 1
+                        continue
+
+                    capacity = cur_sum + size
+                    if capacity < load:
+                        # Try the next larger bin for the last position.
+                        j += 1
+                        continue
+
+                    idx[i] = j
+
+                    # Discard previously found combinations should the
+                    # current one have a lower capacity.
+                    if capacity < capacity_min:
+                        capacity_min = capacity
+                        num_combos = 0
+
+                    if num_combos == combos_max:
+                        grown = <int64_t *> PyMem_Realloc(
+                            combos, 2 * combos_max * n * sizeof(int64_t)
+                        )
+                        if grown == NULL:
+                            raise MemoryError()
+                        combos = grown
+                        combos_max *= 2
+
+                    memcpy(&combos[num_combos * n], idx, n * sizeof(int64_t))
+                    num_combos += 1
+
+            # Backtrack to the previous position and try its next larger bin.
+            i -= 1
+            if i >= 0:
+                j = idx[i]
+                cur_sum -= sizes[j]
+                j += 1
+
+        result = numpy.empty((num_combos, n), dtype=numpy.int64)
+        result_view = result
+        for k in range(num_combos):
+            memcpy(&result_view[k, 0], &combos[k * n], n * sizeof(int64_t))
+    finally:
+        PyMem_Free(idx)
+        PyMem_Free(combos)
+
+    return capacity_min, result
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+""" Compiled kernels for the bin-packing solvers.
+
+This module contains optional Numba-compiled and Cython-compiled versions of
+the inner loops behind the solver-classes. Both operate on NumPy arrays. NumPy,
+Numba, and the Cython extension are optional so should they not be available
+`NUMBA_AVAILABLE` and `CYTHON_AVAILABLE` are `False` and the solvers fall back
+to their pure-Python implementations.
+"""
+
+import functools
+import importlib.util
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from .solvers_core import fit_n_bins_core
+except ImportError:
+    fit_n_bins_core = None
+
+NUMPY_AVAILABLE = numpy is not None
+# Numba is only looked up here, rather than imported, as importing it is far
+# slower than importing the rest of the package. It's imported by
+# `numba_kernel` upon the first search that uses it.
+NUMBA_AVAILABLE = (
+    NUMPY_AVAILABLE and importlib.util.find_spec("numba") is not None
+)
+CYTHON_AVAILABLE = NUMPY_AVAILABLE and fit_n_bins_core is not None
+
+
+def _fit_n_bins_kernel(sizes, n, load, capacity_max):
+    """Enumerates n-length minimum-capacity bin combinations
+
+    This function mirrors `solvers._enumerate_multiset_sums`, i.e., it walks
+    through the replacement-combinations of `sizes` as a vector of
+    non-decreasing indices while keeping a running sum of the picked bins and
+    pruning branches that either exceed the minimum capacity or can't
+    accommodate the load. It's written as a flat loop over arrays so that it
+    can be compiled by Numba.
+
+    Args:
+        sizes (numpy.ndarray): The sorted distinct bin sizes as an `int64`
+            array.
+        n (int): The length of the bin-combinations.
+        load (int): The load to be fit into the bins.
+        capacity_max (int): The maximum capacity of the found combinations.
+
+    Returns:
+        tuple: The minimum capacity and an `(M, n)` array holding the indices
+            of the bins, within `sizes`, of each of the `M` found
+            combinations.
+    """
+
+    num_sizes = sizes.shape[0]
+    size_max = sizes[num_sizes - 1]
+    capacity_min = capacity_max
+
+    # Output buffer of bin-indices grown by doubling when full.
+    combos = numpy.empty((16, n), dtype=numpy.int64)
+    num_combos = 0
+
+    idx = numpy.zeros(n, dtype=numpy.int64)
+    i = 0
+    j = 0
+    cur_sum = 0
+    while i >= 0:
+        if j < num_sizes:
+            size = sizes[j]
+            remaining = n - i
+            if (
+                cur_sum + remaining * size <= capacity_min and
+                cur_sum + remaining * size_max >= load
+            ):
+                if i < n - 1:
+                    # Pick the bin and move on to the next position.
+                    idx[i] = j
+                    cur_sum += size
+                    i += 1
+                    continue
+
+                capacity = cur_sum + size
+                if capacity < load:
+                    # Try the next larger bin for the last position.
+                    j += 1
+                    continue
+
+                idx[i] = j
+
+                # Discard previously found combinations should the current one
+                # have a lower capacity.
+                if capacity < capacity_min:
+                    capacity_min = capacity
+                    num_combos = 0
+
+                if num_combos == combos.shape[0]:
+                    grown = numpy.empty((2 * num_combos, n), dtype=numpy.int64)
+                    grown[:num_combos] = combos
+                    combos = grown
+
+                combos[num_combos, :] = idx
+                num_combos += 1
+
+        # Backtrack to the previous position and try its next larger bin.
+        i -= 1
+        if i >= 0:
+            j = idx[i]
+            cur_sum -= sizes[j]
+            j += 1
+
+    return capacity_min, combos[:num_combos]
+
+
+@functools.lru_cache(maxsize=None)
+def numba_kernel():
+    """Compiles `_fit_n_bins_kernel` via Numba
+
+    Numba is imported, and the kernel wrapped, upon the first call rather than
+    when this module is imported so that `import pbp` doesn't pay for Numba
+    unless its kernel is actually used, i.e., when the Cython extension isn't
+    available.
+
+    Returns:
+        function: The Numba-compiled `_fit_n_bins_kernel`.
+    """
+
+    import numba
+
+    return numba.njit(cache=True)(_fit_n_bins_kernel)
+
+
+@functools.lru_cache(maxsize=None)
+def sizes_array(sizes):
+    """Converts the sorted distinct bin sizes to a read-only `int64` array
+
+    The conversion is cached so that it only happens once for a given set of
+    bins, which is why the returned array is read-only.
+
+    Args:
+        sizes (tuple): The sorted distinct bin sizes.
+
+    Returns:
+        numpy.ndarray: The bin sizes as an `int64` array.
+    """
+
+    sizes_arr = numpy.asarray(sizes, dtype=numpy.int64)
+    sizes_arr.setflags(write=False)
+
+    return sizes_arr
+
+
+def fit_n_bins_numba(sizes, n, load, capacity_max):
+    """Finds n-length minimum-capacity bin combinations via Numba
+
+    Args:
+        sizes (tuple): The sorted distinct bin sizes.
+        n (int): The length of the bin-combinations.
+        load (int): The load to be fit into the bins.
+        capacity_max (int): The maximum capacity of the found combinations.
+
+    Returns:
+        tuple: The capacity of the found n-length bin combinations, or `None`,
+            and a tuple of the combinations.
+    """
+
+    sizes_arr = sizes_array(sizes)
+
+    capacity_min, combos = numba_kernel()(sizes_arr, n, load, capacity_max)
+
+    return _map_combos(sizes_arr, capacity_min, combos)
+
+
+def fit_n_bins_cython(sizes, n, load, capacity_max):
+    """Finds n-length minimum-capacity bin combinations via Cython
+
+    Args:
+        sizes (tuple): The sorted distinct bin sizes.
+        n (int): The length of the bin-combinations.
+        load (int): The load to be fit into the bins.
+        capacity_max (int): The maximum capacity of the found combinations.
+
+    Returns:
+        tuple: The capacity of the found n-length bin combinations, or `None`,
+            and a tuple of the combinations.
+    """
+
+    sizes_arr = sizes_array(sizes)
+
+    capacity_min, combos = fit_n_bins_core(sizes_arr, n, load, capacity_max)
+
+    return _map_combos(sizes_arr, capacity_min, combos)
+
+
+def _map_combos(sizes_arr, capacity_min, combos):
+    """Maps the bin-indices found by a kernel back to bin sizes
+
+    Args:
+        sizes_arr (numpy.ndarray): The sorted distinct bin sizes.
+        capacity_min (int): The capacity of the found combinations.
+        combos (numpy.ndarray): An `(M, n)` array holding the indices of the
+            bins of each of the `M` found combinations.
+
+    Returns:
+        tuple: The capacity of the found combinations, or `None`, and a tuple
+            of the combinations.
+    """
+
+    if not len(combos):
+        return None, ()
+
+    combos = tuple(tuple(combo) for combo in sizes_arr[combos].tolist())
+
+    return int(capacity_min), combos
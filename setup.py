@@ -3,7 +3,12 @@
 
 """The setup script."""
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -30,11 +35,33 @@ setup_requirements = [
     'pytest-runner'
 ]
 
+extras_requirements = {
+    'numpy': ['numpy'],
+    'numba': ['numba'],
+}
+
 test_requirements = [
     'pytest==3.1.3',
     'pytest-runner'
 ]
 
+# Compile the optional Cython extension, which `pyproject.toml` declares as a
+# build requirement. The extension is marked optional so that a failed build,
+# e.g., without a C compiler, doesn't fail the installation; the solvers then
+# fall back to the Numba or pure-Python implementations.
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "pbp.solvers_core",
+                ["pbp/solvers_core.pyx"],
+                optional=True,
+            )
+        ],
+        language_level=3,
+    )
+
 setup(
     name='pbp',
     version='0.1.0',
@@ -44,6 +71,7 @@ setup(
     author_email='somada141@gmail.com',
     url='https://github.com/somada141/pbp',
     packages=find_packages(include=['pbp']),
+    ext_modules=ext_modules,
     entry_points={
         'console_scripts': [
             'pbp=pbp.pbp:main'
@@ -51,6 +79,7 @@ setup(
     },
     include_package_data=True,
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     zip_safe=False,
     keywords='pbp',
@@ -59,14 +88,13 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
     ],
+    python_requires='>=3.6',
     test_suite='tests',
     tests_require=test_requirements,
     setup_requires=setup_requirements,
@@ -4,6 +4,8 @@
 """Tests for `solvers` module."""
 
 
+import os
+
 import pytest
 
 from pbp import solvers
@@ -17,7 +19,7 @@ def fixture_ref_6_2_3_5():
         "load": 6,
         "bins": [2, 3, 5],
         "solutions": {
-            key: [(3, 3)] for key in ["length", "capacity", "combo"]
+            key: ((3, 3),) for key in ["length", "capacity", "combo"]
         }
     }
 
@@ -32,9 +34,9 @@ def fixture_ref_9_2_3_5():
         "load": 9,
         "bins": [2, 3, 5],
         "solutions": {
-            "length": [(5, 5)],
-            "capacity": [(2, 2, 5), (3, 3, 3)],
-            "combo": [(2, 2, 5), (3, 3, 3)]
+            "length": ((5, 5),),
+            "capacity": ((2, 2, 5), (3, 3, 3)),
+            "combo": ((2, 2, 5), (3, 3, 3))
         }
     }
 
@@ -49,7 +51,22 @@ def fixture_ref_11_2_3_5():
         "load": 11,
         "bins": [2, 3, 5],
         "solutions": {
-            key: [(3, 3, 5)] for key in ["length", "capacity", "combo"]
+            key: ((3, 3, 5),) for key in ["length", "capacity", "combo"]
+        }
+    }
+
+    return ref
+
+
+@pytest.fixture(name="ref_7_4_6")
+def fixture_ref_7_4_6():
+    """Reference for (load, bins) of 7, [4, 6], i.e., without an exact fit."""
+
+    ref = {
+        "load": 7,
+        "bins": [4, 6],
+        "solutions": {
+            key: ((4, 4),) for key in ["length", "capacity", "combo"]
         }
     }
 
@@ -108,3 +125,129 @@ def test_ref_11_2_3_5(ref_11_2_3_5):
         solutions_refr = ref["solutions"][solver_type]
         solutions_eval = result
         assert solutions_refr == solutions_eval
+
+
+def test_ref_7_4_6(ref_7_4_6):
+
+    ref = ref_7_4_6
+
+    for solver_type in ["length", "capacity", "combo"]:
+        solver = solvers.create_solver(
+            load=ref["load"],
+            bins=ref["bins"],
+            solver_type=solver_type
+        )
+
+        result = solver.solve()
+
+        solutions_refr = ref["solutions"][solver_type]
+        solutions_eval = result
+        assert solutions_refr == solutions_eval
+
+
+def test_zero_size_bin():
+
+    for solver_type in ["length", "capacity", "combo"]:
+        solver = solvers.create_solver(
+            load=8,
+            bins=[0, 4],
+            solver_type=solver_type
+        )
+
+        assert solver.solve() == ((4, 4),)
+
+
+def test_solver_read_only():
+
+    solver = solvers.SolverLengthFirst(load=6, bins=[2, 3, 5])
+
+    with pytest.raises(AttributeError):
+        solver.load = 11
+    with pytest.raises(AttributeError):
+        solver.bins = [4, 6]
+
+    assert solver.load == 6
+    assert solver.bins == [2, 3, 5]
+    assert solver.solve() == ((3, 3),)
+
+
+def test_fit_n_bins_unsorted_duplicate_bins():
+
+    solver = solvers.SolverLengthFirst(load=9, bins=[5, 3, 2, 3, 5])
+
+    assert solver.fit_n_bins(n=3) == solvers.FitResult(
+        capacity=9,
+        combos=((2, 2, 5), (3, 3, 3))
+    )
+    assert solver.fit_n_bins(n=1) == solvers.FitResult(
+        capacity=None,
+        combos=()
+    )
+
+
+@pytest.mark.parametrize("kernel", ["python", "numba", "cython"])
+def test_fit_n_bins_enumeration(monkeypatch, kernel):
+
+    if kernel == "numba" and not solvers.solvers_kernels.NUMBA_AVAILABLE:
+        # Fail rather than skip where Numba is expected to be installed.
+        if os.environ.get("PBP_REQUIRE_NUMBA"):
+            pytest.fail("Numba is not available")
+        pytest.skip("Numba is not available")
+    if kernel == "cython" and not solvers.solvers_kernels.CYTHON_AVAILABLE:
+        # Fail rather than skip where the extension is expected to be built.
+        if os.environ.get("PBP_REQUIRE_CYTHON"):
+            pytest.fail("The Cython extension is not built")
+        pytest.skip("The Cython extension is not built")
+
+    # Force the enumeration path by disallowing any table of capacities.
+    monkeypatch.setattr(solvers, "DP_TABLE_SIZE_MAX", 0)
+    monkeypatch.setattr(
+        solvers.solvers_kernels, "NUMBA_AVAILABLE", kernel == "numba"
+    )
+    monkeypatch.setattr(
+        solvers.solvers_kernels, "CYTHON_AVAILABLE", kernel == "cython"
+    )
+    solvers.SolverBase.cache_clear()
+
+    solver = solvers.SolverLengthFirst(load=9, bins=[5, 2, 3, 2, 5])
+
+    assert solver.fit_n_bins(n=2).combos == ((5, 5),)
+    assert solver.fit_n_bins(n=3).combos == ((2, 2, 5), (3, 3, 3))
+    assert solver.fit_n_bins(n=4) == solvers.FitResult(
+        capacity=9,
+        combos=((2, 2, 2, 3),)
+    )
+
+    solvers.SolverBase.cache_clear()
+
+
+def test_create_solver_registry():
+
+    for solver_type, solver_cls in [
+        ("length", solvers.SolverLengthFirst),
+        ("capacity", solvers.SolverCapacityFirst),
+        ("combo", solvers.SolverCombo),
+    ]:
+        solver = solvers.create_solver(
+            load=6,
+            bins=[2, 3, 5],
+            solver_type=solver_type
+        )
+        assert isinstance(solver, solver_cls)
+
+    assert solvers.create_solver(
+        load=6,
+        bins=[2, 3, 5],
+        solver_type="unknown"
+    ) is None
+
+
+def test_fit_n_bins_gcd():
+
+    solver = solvers.SolverLengthFirst(load=90, bins=[20, 30, 50])
+
+    assert solver.fit_n_bins(n=3) == solvers.FitResult(
+        capacity=90,
+        combos=((20, 20, 50), (30, 30, 30))
+    )
+    assert solver.solve() == ((50, 50),)